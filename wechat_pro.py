@@ -10,10 +10,15 @@ import math
 import logging
 import sqlite3
 import re
+import zlib
+import datetime
+import collections
+import queue
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
 from typing import Optional, List, Tuple, Dict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 # === 依赖库检查与环境准备 ===
 
@@ -372,7 +377,6 @@ class MessageTemplate:
         True
     """
     
-    import re
     _pattern = re.compile(r'\{(\w+)(?::([^}]+))?\}')
     
     def __init__(self):
@@ -535,7 +539,6 @@ class HistoryManager:
         Returns:
             包含今日发送量、成功率等统计信息的字典
         """
-        import datetime
         now = datetime.datetime.now()
         today_start = datetime.datetime(now.year, now.month, now.day)
         today_end = today_start + datetime.timedelta(days=1) - datetime.timedelta(seconds=1)
@@ -636,9 +639,17 @@ class SemanticEngine(IStealthEngine):
         "\u202c", "\u202d", "\u202e", "\u2066",
         "\u2067", "\u2068", "\u2069", "\u00a0",
     ]
+    NOISE_TABLE_BITS = 8
+    MAX_INJECTIONS = 4
 
     def __init__(self):
-        pass
+        # NOTE: 使用独立的 Random 实例，并预生成各长度的噪声串，发送时只需一次 getrandbits 查表
+        self._rng = random.Random()
+        table_size = 1 << self.NOISE_TABLE_BITS
+        self._noise_tables = {
+            k: ["".join(self._rng.choices(self.INVISIBLE_CHARS, k=k)) for _ in range(table_size)]
+            for k in range(1, self.MAX_INJECTIONS + 1)
+        }
 
     def humanize(self, base_content: str, count_threshold: int, current_idx: int, use_stealth: bool = True) -> str:
         """对消息内容进行隐形处理
@@ -665,23 +676,23 @@ class SemanticEngine(IStealthEngine):
         if count_threshold <= 1:
             return base_content
 
+        rng = self._rng
         content_len = len(base_content)
         
         if content_len < 10:
-            num_injections = random.randint(1, 2)
+            num_injections = 1 + rng.getrandbits(1)
         else:
-            num_injections = random.randint(2, 4)
+            num_injections = 2 + rng.randrange(3)
 
+        noise = self._noise_tables[num_injections][rng.getrandbits(self.NOISE_TABLE_BITS)]
         if num_injections >= content_len:
-            noise = "".join(random.choices(self.INVISIBLE_CHARS, k=num_injections))
             return f"{base_content}{noise}"
 
-        positions = sorted(random.sample(range(content_len), num_injections))
+        positions = sorted(rng.sample(range(content_len), num_injections))
         
         result = list(base_content)
         offset = 0
-        for pos in positions:
-            char = random.choice(self.INVISIBLE_CHARS)
+        for pos, char in zip(positions, noise):
             result.insert(pos + offset, char)
             offset += 1
         
@@ -690,23 +701,34 @@ class SemanticEngine(IStealthEngine):
 class ImageStealthEngine(IImageStealthEngine):
     """图像隐形引擎
     
-    通过修改图片像素和二进制数据实现图片差异化，绕过平台重复检测。
-    支持多像素随机扰动和二进制噪声注入。
+    通过改写图片二进制数据（必要时回退到像素扰动）实现图片差异化，绕过平台重复检测。
+    支持格式感知的字节级改写、多像素随机扰动和二进制噪声注入。
     
     Attributes:
         temp_dir: 临时文件存储目录
         current_batch_files: 当前批次处理的临时文件列表
+        SLOT_COUNT: 轮换使用的临时文件名槽位数量
         
     Example:
         >>> engine = ImageStealthEngine()
         >>> processed = engine.process_batch(["image1.png", "image2.jpg"])
         >>> engine.cleanup_last_batch()  # 清理临时文件
     """
+    SLOT_COUNT = 64
+
     def __init__(self):
         self.temp_dir = os.path.join(tempfile.gettempdir(), "wechat_pro_stealth_cache")
         if not os.path.exists(self.temp_dir):
             os.makedirs(self.temp_dir)
         self.current_batch_files = []
+        # NOTE: 固定数量的文件名槽位轮换复用，覆盖写代替反复创建/删除新文件，临时目录占用也有上限
+        # 文件名带进程号与实例标识，多开程序或新旧 worker 并存时不会互相覆盖/误删
+        self._name_prefix = os.path.join(self.temp_dir, f"stealth_{os.getpid()}_{id(self):x}")
+        self._slot_paths = [f"{self._name_prefix}_{i:03d}" for i in range(self.SLOT_COUNT)]
+        self._slot_idx = 0
+        self._written_paths = set()
+        # NOTE: 多文件批次复用同一个线程池，首次需要时再创建
+        self._executor = None
 
     def process_batch(self, file_paths: List[str]) -> List[str]:
         """批量处理图片文件
@@ -719,37 +741,119 @@ class ImageStealthEngine(IImageStealthEngine):
         Returns:
             处理后的文件路径列表（图片为临时文件路径，视频为原路径）
         """
-        self.cleanup_last_batch()
-        new_paths = []
+        self.current_batch_files = []
         video_exts = ['.mp4', '.mov', '.avi', '.mkv', '.wmv']
         
-        for path in file_paths:
-            ext = os.path.splitext(path)[1].lower()
-            if ext in video_exts:
-                new_paths.append(path)
-                continue
-                
-            try:
-                processed_path = self._process_single_file(path)
-                new_paths.append(processed_path)
+        new_paths = list(file_paths)
+        pending = [i for i, path in enumerate(file_paths)
+                   if os.path.splitext(path)[1].lower() not in video_exts]
+        if not pending:
+            return new_paths
+
+        # 槽位在分发前按顺序分配，工作线程之间不会写同一个文件
+        jobs = []
+        if len(pending) > self.SLOT_COUNT:
+            # 单批文件数超过槽位数时槽位会在批内回绕而互相覆盖，改用本批唯一的文件名
+            batch_tag = time.time_ns()
+            for n, i in enumerate(pending):
+                jobs.append((file_paths[i], f"{self._name_prefix}_{batch_tag}_{n:04d}"))
+        else:
+            for i in pending:
+                jobs.append((file_paths[i], self._slot_paths[self._slot_idx % self.SLOT_COUNT]))
+                self._slot_idx += 1
+
+        # NOTE: 单文件处理以磁盘 I/O 为主；单个文件直接在当前线程处理，多个文件交给线程池并行，map 保证结果顺序与输入一致
+        if len(jobs) == 1:
+            results = [self._try_process_single_file(*jobs[0])]
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=8)
+            results = list(self._executor.map(lambda job: self._try_process_single_file(*job), jobs))
+
+        for i, processed_path in zip(pending, results):
+            if processed_path:
+                new_paths[i] = processed_path
                 self.current_batch_files.append(processed_path)
-            except Exception as e:
-                new_paths.append(path)
+                self._written_paths.add(processed_path)
         return new_paths
 
-    def _process_single_file(self, path: str) -> str:
+    def _try_process_single_file(self, path: str, slot: str) -> Optional[str]:
+        try:
+            return self._process_single_file(path, slot)
+        except Exception as e:
+            logger.debug(f"ImageStealthEngine._process_single_file: {path} - {e}")
+            return None
+
+    def _process_single_file(self, path: str, slot: str) -> str:
         ext = os.path.splitext(path)[1].lower()
-        filename = f"stealth_{int(time.time()*1000)}_{random.randint(1000,9999)}{ext}"
-        save_path = os.path.join(self.temp_dir, filename)
+        save_path = f"{slot}{ext}"
+        # 先写入同目录临时文件，再原子替换到槽位，避免读到写了一半的文件
+        tmp_path = f"{slot}.part{ext}"
 
-        if ext in ['.gif', '.webp']:
-            self._inject_binary_noise(path, save_path)
-        elif ext in ['.jpg', '.jpeg', '.png', '.bmp']:
-            self._perturb_pixels(path, save_path)
-        else:
-            shutil.copy2(path, save_path)
+        try:
+            if ext in ['.gif', '.webp']:
+                self._inject_binary_noise(path, tmp_path)
+            elif ext in ['.jpg', '.jpeg', '.png', '.bmp']:
+                # NOTE: 优先直接改写文件字节，跳过 PIL 解码+重编码；仅格式无法识别时回退到像素扰动
+                if not self._mutate_bytes(path, tmp_path):
+                    self._perturb_pixels(path, tmp_path)
+            else:
+                shutil.copy2(path, tmp_path)
+            os.replace(tmp_path, save_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         return save_path
 
+    def _mutate_bytes(self, src: str, dst: str) -> bool:
+        """直接修改文件二进制实现 Hash 差异化
+
+        - JPEG：在开头的 APPn 段（JFIF/Exif 等）之后插入随机内容的 COM 注释段，保留结尾的 0xFFD9
+        - PNG：在 IEND 之前插入随机长度的 tEXt 辅助块（含 CRC32 校验）
+        - BMP：在像素数据之后追加随机字节
+
+        保留源文件元数据（等同 shutil.copy2）。
+
+        Args:
+            src: 源文件路径
+            dst: 目标文件路径
+
+        Returns:
+            bool: 处理成功返回 True；文件格式无法识别时返回 False
+        """
+        with open(src, 'rb') as f:
+            data = f.read()
+
+        noise = os.urandom(random.randint(4, 8)).hex().encode('ascii')
+        if data[:2] == b'\xff\xd8' and data[-2:] == b'\xff\xd9':
+            # 跳过 SOI 后紧跟的 APPn 段，保证 JFIF APP0 / Exif APP1 仍位于文件开头
+            pos = 2
+            while pos + 4 <= len(data) and data[pos] == 0xFF and 0xE0 <= data[pos + 1] <= 0xEF:
+                pos += 2 + int.from_bytes(data[pos + 2:pos + 4], 'big')
+            if pos > len(data) - 2:
+                return False
+            segment = b'\xff\xfe' + (len(noise) + 2).to_bytes(2, 'big') + noise
+            out = data[:pos] + segment + data[pos:]
+        elif data[:8] == b'\x89PNG\r\n\x1a\n':
+            iend = data.rfind(b'IEND')
+            if iend < 12:
+                return False
+            body = b'Comment\x00' + noise
+            chunk = (len(body).to_bytes(4, 'big') + b'tEXt' + body
+                     + zlib.crc32(b'tEXt' + body).to_bytes(4, 'big'))
+            # IEND 块的长度字段位于类型标识之前 4 字节
+            out = data[:iend - 4] + chunk + data[iend - 4:]
+        elif data[:2] == b'BM':
+            out = data + noise
+        else:
+            return False
+
+        with open(dst, 'wb') as f:
+            f.write(out)
+        shutil.copystat(src, dst)
+        return True
+
     def _perturb_pixels(self, src: str, dst: str):
         try:
             with Image.open(src) as img:
@@ -764,17 +868,18 @@ class ImageStealthEngine(IImageStealthEngine):
                     for _ in range(num_pixels)
                 ]
                 
+                # NOTE: 通过 img.load() 的像素访问对象直接读写，避开 getpixel/putpixel 的逐次加锁开销
+                pixels = img.load()
                 for x, y in pixels_to_modify:
-                    pixel = list(img.getpixel((x, y)))
-                    delta = random.randint(-3, 3)
-                    if delta == 0:
-                        delta = 1
-                    for i in range(min(3, len(pixel))):
-                        new_val = pixel[i] + delta
-                        pixel[i] = max(0, min(255, new_val))
-                    img.putpixel((x, y), tuple(pixel))
+                    pixel = pixels[x, y]
+                    delta = random.randint(-3, 3) or 1
+                    pixels[x, y] = tuple(
+                        max(0, min(255, v + delta)) if i < 3 else v
+                        for i, v in enumerate(pixel)
+                    )
                 
-                img.save(dst, quality=95, optimize=True)
+                # 只改动少量像素，无需 optimize 重新计算 Huffman 表
+                img.save(dst, quality=95)
         except Exception as e:
             logger.debug(f"ImageStealthEngine._perturb_pixels: {e}")
             self._inject_binary_noise(src, dst)
@@ -785,11 +890,19 @@ class ImageStealthEngine(IImageStealthEngine):
             f.write(os.urandom(random.randint(4, 8)))
 
     def cleanup_last_batch(self):
-        for p in self.current_batch_files:
+        """删除所有已写入的槽位文件
+
+        槽位轮换复用，批次之间无需清理；任务结束时调用一次即可，同时关闭批处理线程池。
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        for p in self._written_paths:
             try:
                 if os.path.exists(p): os.remove(p)
             except Exception as e:
                 logger.debug(f"ImageStealthEngine.cleanup_last_batch: 删除 {p} 失败 - {e}")
+        self._written_paths.clear()
         self.current_batch_files = []
 
 # ==========================================
@@ -832,12 +945,53 @@ class HumanMimicry:
         except Exception as e:
             logger.debug(f"HumanMimicry.random_jitter: {e}")
     
+    @staticmethod
+    def _bezier_points(p0, p1, n):
+        """生成起点到终点的三阶贝塞尔曲线轨迹点
+
+        控制点沿路径随机偏移，并随机选用一种缓动函数分布采样点。
+
+        Args:
+            p0: 起点坐标 (x, y)
+            p1: 终点坐标 (x, y)
+            n: 分段数，返回 n + 1 个点
+
+        Returns:
+            List[Tuple[int, int]]: 轨迹点列表（含起点与终点）
+        """
+        start_x, start_y = p0
+        target_x, target_y = p1
+
+        ctrl1_x = start_x + (target_x - start_x) * random.uniform(0.2, 0.4) + random.randint(-50, 50)
+        ctrl1_y = start_y + (target_y - start_y) * random.uniform(0.2, 0.4) + random.randint(-50, 50)
+        ctrl2_x = start_x + (target_x - start_x) * random.uniform(0.6, 0.8) + random.randint(-50, 50)
+        ctrl2_y = start_y + (target_y - start_y) * random.uniform(0.6, 0.8) + random.randint(-50, 50)
+
+        easing_func = random.choice(HumanMimicry.EASING_FUNCTIONS)
+
+        # NOTE: 展开为多项式系数后用 Horner 形式求值，每个点只需 3 次乘加
+        ax = -start_x + 3 * ctrl1_x - 3 * ctrl2_x + target_x
+        bx = 3 * start_x - 6 * ctrl1_x + 3 * ctrl2_x
+        cx = 3 * (ctrl1_x - start_x)
+        ay = -start_y + 3 * ctrl1_y - 3 * ctrl2_y + target_y
+        by = 3 * start_y - 6 * ctrl1_y + 3 * ctrl2_y
+        cy = 3 * (ctrl1_y - start_y)
+
+        points = []
+        for i in range(n + 1):
+            t = easing_func(i / n)
+            points.append((int(((ax * t + bx) * t + cx) * t + start_x),
+                           int(((ay * t + by) * t + cy) * t + start_y)))
+        return points
+
     @staticmethod
     def smooth_move_to(target_x, target_y):
         """使用贝塞尔曲线模拟真人手部移动鼠标
         
         通过三阶贝塞尔曲线生成自然的鼠标移动轨迹，
         随机生成控制点和选择缓动函数，模拟人类操作。
+        轨迹点预先算好，再通过 SetCursorPos 按截止时间逐点落位，
+        不经过 pyautogui 的补间与 PAUSE 等待。
         
         Args:
             target_x: 目标 X 坐标
@@ -845,7 +999,7 @@ class HumanMimicry:
             
         Note:
             - 移动时间：0.3-0.8 秒随机
-            - 步数：20-40 步随机
+            - 步数：按距离计算，至少 20 步
             - 目标位置会有 ±3 像素的随机偏移
         """
         try:
@@ -856,26 +1010,60 @@ class HumanMimicry:
             
             dist = math.sqrt((target_x - start_x) ** 2 + (target_y - start_y) ** 2)
             duration = random.uniform(0.3, 0.8)
+            steps = max(20, int(dist * 0.1))
             
-            ctrl1_x = start_x + (target_x - start_x) * random.uniform(0.2, 0.4) + random.randint(-50, 50)
-            ctrl1_y = start_y + (target_y - start_y) * random.uniform(0.2, 0.4) + random.randint(-50, 50)
-            ctrl2_x = start_x + (target_x - start_x) * random.uniform(0.6, 0.8) + random.randint(-50, 50)
-            ctrl2_y = start_y + (target_y - start_y) * random.uniform(0.6, 0.8) + random.randint(-50, 50)
-            
-            steps = random.randint(20, 40)
-            easing_func = random.choice(HumanMimicry.EASING_FUNCTIONS)
+            points = HumanMimicry._bezier_points((start_x, start_y), (target_x, target_y), steps)
             
-            for i in range(steps + 1):
-                t = easing_func(i / steps)
-                
-                x = (1-t)**3 * start_x + 3*(1-t)**2*t * ctrl1_x + 3*(1-t)*t**2 * ctrl2_x + t**3 * target_x
-                y= (1-t)**3 * start_y+ 3*(1-t)**2*t * ctrl1_y+ 3*(1-t)*t**2 * ctrl2_y+ t**3 * target_y
-                
-                pyautogui.moveTo(int(x), int(y), duration=duration/steps, _pause=False)
+            set_cursor_pos = ctypes.windll.user32.SetCursorPos
+            perf_counter = time.perf_counter
+            step_time = duration / steps
+            t0 = perf_counter()
+            for i, (x, y) in enumerate(points):
+                # 先等到本步的预定时刻再落点，保证每个点都按时间表出现
+                delay = t0 + i * step_time - perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                set_cursor_pos(x, y)
                 
         except Exception as e:
             logger.debug(f"HumanMimicry.smooth_move_to: {e}")
 
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _INPUT_UNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    """Win32 INPUT 结构体（SendInput 参数）"""
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUT_UNION)]
+
+
+def _build_key_inputs(*events: Tuple[int, bool]) -> ctypes.Array:
+    """构造 SendInput 所需的键盘事件数组
+
+    Args:
+        *events: (虚拟键码, 是否抬起) 序列
+
+    Returns:
+        ctypes INPUT 数组
+    """
+    arr = (_INPUT * len(events))()
+    for i, (vk, key_up) in enumerate(events):
+        arr[i].type = 1  # INPUT_KEYBOARD
+        arr[i].u.ki.wVk = vk
+        arr[i].u.ki.dwFlags = 0x0002 if key_up else 0  # KEYEVENTF_KEYUP
+    return arr
+
+
 class WeChatDriver(IMessageDriver):
     """微信窗口驱动
     
@@ -895,6 +1083,13 @@ class WeChatDriver(IMessageDriver):
     def __init__(self):
         self.wechat_window = None
         self.hwnd = 0 
+        # NOTE: 仅缓存输入框控件，避免每次发送都触发 UIA 树查询；坐标每次实时读取，窗口移动后仍准确
+        self._edit_ctrl = None
+        self.session_list = None
+        # NOTE: 预构造 SendInput 事件数组，极速模式下一次系统调用完成整组按键
+        VK_CONTROL, VK_V, VK_RETURN = 0x11, 0x56, 0x0D
+        self._ctrl_v_inputs = _build_key_inputs((VK_CONTROL, False), (VK_V, False), (VK_V, True), (VK_CONTROL, True))
+        self._enter_inputs = _build_key_inputs((VK_RETURN, False), (VK_RETURN, True))
     
     def connect(self) -> bool:
         """连接微信窗口
@@ -923,6 +1118,8 @@ class WeChatDriver(IMessageDriver):
                 if win.Exists(maxSearchSeconds=0.5):
                     self.wechat_window = win
                     self.hwnd = win.NativeWindowHandle 
+                    self.session_list = win.ListControl(Name="会话")
+                    self._invalidate_input_box()
                     return True
             except Exception as e:
                 logger.debug(f"WeChatDriver.connect: 查询 {q} 失败 - {e}")
@@ -968,52 +1165,77 @@ class WeChatDriver(IMessageDriver):
             enable_human: 是否启用真人拟态模式（贝塞尔曲线移动）
         """
         if not self.wechat_window: return
-        try:
-            edit = self.wechat_window.EditControl(Name="输入")
-            target_control = None
-            
-            if edit.Exists(maxSearchSeconds=0.1):
-                target_control = edit
-            else:
-                edits = [c for c in self.wechat_window.GetChildren() if c.ControlTypeName == "EditControl"]
-                if edits:
-                    target_control = edits[-1]
-
-            if target_control:
-                if enable_human:
-                    rect = target_control.BoundingRectangle
-                    cx = (rect.left + rect.right) // 2
-                    cy = (rect.top + rect.bottom) // 2
-                    HumanMimicry.smooth_move_to(cx, cy)
-                    pyautogui.click()
-                    time.sleep(1)
-                    pyautogui.click()
-                else:
-                    pyautogui.click()
-                    time.sleep(1)
-                    pyautogui.click()
+        # NOTE: 缓存的控件失效时清除缓存并重新定位一次，避免本目标漏掉聚焦
+        for attempt in range(2):
+            try:
+                self._focus_input_box_once(enable_human)
                 return
+            except Exception as e:
+                self._invalidate_input_box()
+                logger.debug(f"WeChatDriver.focus_input_box (attempt {attempt + 1}): {e}")
+
+    def _focus_input_box_once(self, enable_human: bool):
+        """执行一次聚焦，失败时直接抛出异常"""
+        target_control = self._find_input_box()
+
+        if target_control:
+            # 控件已失效时此处抛异常，由调用方清除缓存后重试
+            rect = target_control.BoundingRectangle
+            cx, cy = (rect.left + rect.right) // 2, (rect.top + rect.bottom) // 2
+            if enable_human:
+                HumanMimicry.smooth_move_to(cx, cy)
+                pyautogui.click(_pause=False)
+                time.sleep(1)
+                pyautogui.click(_pause=False)
+            else:
+                # 会话列表点选后光标停在列表上，须点击输入框本身才能把键盘焦点移过去
+                pyautogui.click(cx, cy, _pause=False)
+                time.sleep(1)
+                pyautogui.click(cx, cy, _pause=False)
+            return
 
-            rect = self.wechat_window.BoundingRectangle
-            if rect.width() > 0 and rect.height() > 0:
-                tx = (rect.left + rect.right) // 2
-                ty = rect.bottom - 60
-                if enable_human:
-                    HumanMimicry.smooth_move_to(tx, ty)
-                    pyautogui.click()
-                    time.sleep(1)
-                    pyautogui.click()
-                else:
-                    pyautogui.click(tx, ty)
-                    time.sleep(1)
-                    pyautogui.click(tx, ty)
-        except Exception as e:
-            logger.debug(f"WeChatDriver.focus_input_box: {e}")
+        rect = self.wechat_window.BoundingRectangle
+        if rect.width() > 0 and rect.height() > 0:
+            tx = (rect.left + rect.right) // 2
+            ty = rect.bottom - 60
+            if enable_human:
+                HumanMimicry.smooth_move_to(tx, ty)
+                pyautogui.click(_pause=False)
+                time.sleep(1)
+                pyautogui.click(_pause=False)
+            else:
+                pyautogui.click(tx, ty, _pause=False)
+                time.sleep(1)
+                pyautogui.click(tx, ty, _pause=False)
+
+    def _find_input_box(self):
+        """定位输入框控件，命中缓存时直接返回
+
+        Returns:
+            输入框控件，未找到时返回 None
+        """
+        if self._edit_ctrl is not None:
+            if self._edit_ctrl.Exists(maxSearchSeconds=0):
+                return self._edit_ctrl
+            self._edit_ctrl = None
+
+        edit = self.wechat_window.EditControl(Name="输入")
+        if edit.Exists(maxSearchSeconds=0.1):
+            self._edit_ctrl = edit
+        else:
+            edits = [c for c in self.wechat_window.GetChildren() if c.ControlTypeName == "EditControl"]
+            if edits:
+                self._edit_ctrl = edits[-1]
+        return self._edit_ctrl
+
+    def _invalidate_input_box(self):
+        """清除输入框缓存，下次聚焦时重新查找"""
+        self._edit_ctrl = None
 
     def search_contact(self, name: str) -> bool:
         """搜索并定位联系人
         
-        通过微信的搜索功能定位指定联系人。
+        优先在左侧会话列表中直接点击目标会话；未命中时再通过微信的搜索功能定位。
         
         Args:
             name: 联系人名称或昵称
@@ -1024,6 +1246,8 @@ class WeChatDriver(IMessageDriver):
         if not self.wechat_window: return False
         try:
             self.activate(force=True)
+            if self._select_session(name):
+                return True
             time.sleep(0.1)
             self.wechat_window.SendKeys('{Ctrl}f')
             time.sleep(0.2)
@@ -1035,6 +1259,34 @@ class WeChatDriver(IMessageDriver):
         except Exception:
             return False
 
+    def _select_session(self, name: str) -> bool:
+        """在会话列表中直接选中联系人
+
+        NOTE: 命中时省去 Ctrl+F 搜索的固定等待与剪贴板读写。
+
+        Args:
+            name: 联系人名称或昵称
+
+        Returns:
+            bool: 找到并点击会话项返回 True；会话项不可见时返回 False，由调用方回退到搜索
+        """
+        if not self.session_list:
+            return False
+        try:
+            item = self.session_list.ListItemControl(searchDepth=2, Name=name)
+            if item.Exists(maxSearchSeconds=0) and not item.IsOffscreen:
+                # NOTE: 滚出可视区或被列表边缘截断的会话项，点击会落空或点到相邻会话，必须完整位于列表内
+                rect = item.BoundingRectangle
+                bounds = self.session_list.BoundingRectangle
+                if (rect.width() > 0 and rect.height() > 0
+                        and rect.left >= bounds.left and rect.right <= bounds.right
+                        and rect.top >= bounds.top and rect.bottom <= bounds.bottom):
+                    item.Click(simulateMove=False)
+                    return True
+        except Exception as e:
+            logger.debug(f"WeChatDriver._select_session: {e}")
+        return False
+
     def send_paste_and_enter(self, enable_human: bool = False):
         """通过剪贴板发送消息
         
@@ -1052,19 +1304,44 @@ class WeChatDriver(IMessageDriver):
             self.wechat_window.SendKeys('{Enter}', waitTime=0.05)
         else:
             # 极速模式（稳定版）：最低间隔由外部 sleep 控制 (0.05s)
-            self.wechat_window.SendKeys('{Ctrl}v', waitTime=0.01)
+            # 微信不在前台或 SendInput 被拦截时，回退到 SendKeys（会先 SetFocus）
+            is_foreground = ctypes.windll.user32.GetForegroundWindow() == self.hwnd
+            if not (is_foreground and self._send_ctrl_v()):
+                self.wechat_window.SendKeys('{Ctrl}v', waitTime=0.01)
             # 这里的 waitTime 极小，但外部循环会有 0.05s 的保障
-            self.wechat_window.SendKeys('{Enter}', waitTime=0.01)
+            if not (is_foreground and self._send_enter()):
+                self.wechat_window.SendKeys('{Enter}', waitTime=0.01)
+
+    def _send_inputs(self, inputs) -> bool:
+        sent = ctypes.windll.user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+        return sent == len(inputs)
+
+    def _send_ctrl_v(self) -> bool:
+        """通过 SendInput 发送 Ctrl+V
+
+        Returns:
+            bool: 全部事件注入成功返回 True
+        """
+        return self._send_inputs(self._ctrl_v_inputs)
+
+    def _send_enter(self) -> bool:
+        """通过 SendInput 发送 Enter
+
+        Returns:
+            bool: 全部事件注入成功返回 True
+        """
+        return self._send_inputs(self._enter_inputs)
 
 # ==========================================
 # 3. 业务逻辑层 (Service)
 # ==========================================
 
-@dataclass
+@dataclass(frozen=True)
 class TaskConfig:
     """任务配置数据类
     
-    封装自动化任务的所有配置参数。
+    封装自动化任务的所有配置参数。实例不可变，运行时修改通过
+    dataclasses.replace 生成新快照，工作线程读取时无需加锁。
     
     Attributes:
         target_list: 目标列表，每个元素为 (名称, 专属消息, 附件列表) 元组
@@ -1136,17 +1413,26 @@ class AutomationWorker(QThread):
         """
         super().__init__()
         self.config = config
-        self._is_running = True
+        self._stop_event = threading.Event()
         self.driver = driver or WeChatDriver()
         self.semantic = stealth_engine or SemanticEngine()
         self.img_stealth = image_stealth_engine or ImageStealthEngine()
-        self._mutex = threading.Lock()
-        self.clipboard_event = threading.Event()
+        self._update_q: queue.Queue = queue.Queue()
+        # NOTE: 每次附件发送创建一个 Future，由 UI 线程回填成功/失败结果
+        self._pending_clip_fut: Optional[Future] = None
         self.history_manager: Optional[HistoryManager] = None
         
         self.msgs_since_break = 0
         self.next_break_threshold = random.randint(TimingConfig.FATIGUE_THRESHOLD_MIN, TimingConfig.FATIGUE_THRESHOLD_MAX)
         self.last_ui_update_time = 0.0
+        # NOTE: 记录最近一次写入剪贴板的文本，内容未变化时跳过 pyperclip.copy
+        self._last_clip: Optional[str] = None
+        # NOTE: 附件隐形预处理放到后台线程，与文字消息的粘贴/发送重叠执行
+        self._stealth_executor = ThreadPoolExecutor(max_workers=1)
+        # NOTE: 高频日志合并后再跨线程发送，避免逐条投递淹没 UI 线程
+        self._pending_log: List[str] = []
+        self._last_log_emit = 0.0
+        self._log_lock = threading.Lock()
     
     def set_history_manager(self, manager: 'HistoryManager'):
         """设置历史记录管理器
@@ -1157,38 +1443,73 @@ class AutomationWorker(QThread):
         self.history_manager = manager
 
     def stop(self):
-        with self._mutex:
-            self._is_running = False
+        self._stop_event.set()
 
     def is_running(self):
-        with self._mutex:
-            return self._is_running
+        return not self._stop_event.is_set()
             
     def update_runtime_content(self, new_msg: str):
-        with self._mutex:
-            self.config.global_msg = new_msg
-            if new_msg:
-                self.sig_log.emit(f"📝 内容已更新: {new_msg[:10]}...")
+        self._update_q.put({'global_msg': new_msg})
+        if new_msg:
+            self._log(f"📝 内容已更新: {new_msg[:10]}...")
 
     def update_runtime_files(self, new_files: List[str]):
-        with self._mutex:
-            self.config.global_files = new_files
-            # NOTE: 优化③：使用 FileHandler.format_file_summary 显示文件类型细节
-            summary = FileHandler.format_file_summary(new_files) if new_files else '0 个'
-            self.sig_log.emit(f"📂 附件列表已更新: {summary}")
+        self._update_q.put({'global_files': new_files})
+        # NOTE: 优化③：使用 FileHandler.format_file_summary 显示文件类型细节
+        summary = FileHandler.format_file_summary(new_files) if new_files else '0 个'
+        self._log(f"📂 附件列表已更新: {summary}")
             
     def update_runtime_params(self, new_count: int, new_interval: float):
-        with self._mutex:
-            self.config.count_per_person = new_count
-            self.config.interval = new_interval
+        self._update_q.put({'count_per_person': new_count, 'interval': new_interval})
+
+    def _log(self, msg: str):
+        """节流发送日志
+
+        距上次发送超过 0.1 秒或遇到 ❌/⚠️ 时，将积压的日志合并为一次 sig_log 发送；
+        其余情况先暂存，由下一次日志、进度刷新或任务结束时带出。
+
+        Args:
+            msg: 日志消息
+        """
+        now = time.time()
+        with self._log_lock:
+            self._pending_log.append(msg)
+            if now - self._last_log_emit > 0.1 or msg.startswith(('❌', '⚠️')):
+                self._emit_pending_log(now)
+
+    def _flush_log(self):
+        """立即发送所有积压日志"""
+        with self._log_lock:
+            if self._pending_log:
+                self._emit_pending_log(time.time())
+
+    def _emit_pending_log(self, now: float):
+        # 调用方需持有 _log_lock
+        self.sig_log.emit("\n".join(self._pending_log))
+        self._pending_log.clear()
+        self._last_log_emit = now
+
+    def _apply_pending_updates(self):
+        """合并运行时更新队列，生成新的配置快照
+
+        仅由工作线程调用；队列为空时直接返回，发送循环中无锁开销。
+        """
+        if self._update_q.empty():
+            return
+        changes = {}
+        while True:
+            try:
+                changes.update(self._update_q.get_nowait())
+            except queue.Empty:
+                break
+        self.config = replace(self.config, **changes)
 
     def _smart_sleep(self, duration: float):
-        with self._mutex:
-            current_interval = self.config.interval
-            if abs(duration - current_interval) < 0.001: 
-                base_duration = current_interval
-            else:
-                base_duration = duration
+        current_interval = self.config.interval
+        if abs(duration - current_interval) < 0.001: 
+            base_duration = current_interval
+        else:
+            base_duration = duration
 
         # [Limit Fix] 物理强制限速 0.05s
         if base_duration < 0.05:
@@ -1199,14 +1520,8 @@ class AutomationWorker(QThread):
             actual_duration = base_duration * random.uniform(0.8, 1.3)
             actual_duration += random.uniform(0.01, 0.05)
 
-        end_time = time.perf_counter() + actual_duration
-        while time.perf_counter() < end_time:
-            if not self.is_running(): return
-            remaining = end_time - time.perf_counter()
-            if remaining < 0.01:
-                if remaining > 0.001: time.sleep(remaining / 2)
-            else:
-                time.sleep(0.005)
+        # NOTE: 由 stop() 置位事件唤醒，无需轮询
+        self._stop_event.wait(timeout=actual_duration)
 
     def _check_human_break(self):
         if not self.config.enable_human_simulation:
@@ -1215,38 +1530,58 @@ class AutomationWorker(QThread):
         self.msgs_since_break += 1
         if self.msgs_since_break >= self.next_break_threshold:
             break_time = random.uniform(3.0, 8.0)
-            self.sig_log.emit(f"☕ 模拟真人疲劳: 暂停 {break_time:.1f} 秒...")
+            self._log(f"☕ 模拟真人疲劳: 暂停 {break_time:.1f} 秒...")
+            self._flush_log()
             HumanMimicry.random_jitter()
             self._smart_sleep(break_time)
             HumanMimicry.random_jitter()
             self.msgs_since_break = 0
             self.next_break_threshold = random.randint(15, 30)
 
+    def _copy_text(self, text: str):
+        if text != self._last_clip:
+            pyperclip.copy(text)
+            self._last_clip = text
+
     def on_clipboard_set_done(self):
-        self.clipboard_event.set()
+        self._last_clip = None
+        fut = self._pending_clip_fut
+        if fut is not None and not fut.done():
+            fut.set_result(True)
+
+    def on_clipboard_set_failed(self, error: Exception):
+        self._last_clip = None
+        fut = self._pending_clip_fut
+        if fut is not None and not fut.done():
+            fut.set_exception(error)
 
     def run(self):
         try:
             # [Fix] 移除 Turbo 判定
+            # NOTE: 节奏统一由 _smart_sleep 与拟态中的显式 sleep 控制，关闭 pyautogui 的隐式 PAUSE
+            pyautogui.PAUSE = 0
             if self.config.enable_human_simulation:
                 self.sig_log.emit("🍃 真人拟态: 开启")
-                pyautogui.PAUSE = 0.3
             else:
                 self.sig_log.emit(f"⚡ 稳定极速: 开启 (Limit: 0.05s)")
-                pyautogui.PAUSE = 0.05 
             
             # 1. 倒计时
             if self.config.target_timestamp > 0:
                 self.sig_log.emit(f"⏳ 引擎已锁定！")
+                # 循环内用到的属性预先绑定为局部变量
+                now_fn = time.time
+                wait = self._stop_event.wait
+                emit_countdown = self.sig_countdown.emit
+                target_ts = self.config.target_timestamp
                 while True:
-                    if not self.is_running(): return
-                    now = time.time()
-                    remaining = self.config.target_timestamp - now
+                    remaining = target_ts - now_fn()
                     if remaining <= 0:
-                        self.sig_countdown.emit(0)
+                        emit_countdown(0)
                         break
-                    self.sig_countdown.emit(int(remaining))
-                    time.sleep(0.1 if remaining < 2 else 0.5)
+                    emit_countdown(int(remaining))
+                    # NOTE: 等待到下一个整秒边界，每秒只唤醒一次；stop() 可随时打断
+                    next_tick = remaining - math.floor(remaining)
+                    if wait(timeout=next_tick or 1.0): return
             
             # 2. 连接微信
             self.sig_log.emit("🔗 正在连接微信...")
@@ -1263,12 +1598,12 @@ class AutomationWorker(QThread):
             
             # 3. 循环执行
             for idx, (name, custom_msg, custom_files) in enumerate(self.config.target_list):
-                if not self.is_running(): break
+                if self._stop_event.is_set(): break
                 
-                with self._mutex:
-                    initial_msg = self.config.global_msg 
-                    initial_files = self.config.global_files 
-                    current_count_setting = self.config.count_per_person
+                self._apply_pending_updates()
+                initial_msg = self.config.global_msg 
+                initial_files = self.config.global_files 
+                current_count_setting = self.config.count_per_person
                 
                 total_ops_est = total_targets * current_count_setting
                 
@@ -1276,36 +1611,41 @@ class AutomationWorker(QThread):
                 
                 if not is_custom_mode and not initial_msg and not initial_files:
                     ops_done += current_count_setting
-                    self.sig_log.emit(f"⚠️ 跳过 [{name}]: 内容为空")
+                    self._log(f"⚠️ 跳过 [{name}]: 内容为空")
                     self.sig_progress.emit(ops_done, total_ops_est, f"跳过: {name}")
                     continue
 
+                # NOTE: 上一个目标退出 ClipboardScope 时已恢复用户剪贴板（含跳过/异常路径），文字缓存一律失效
+                self._last_clip = None
                 try:
                     with ClipboardScope():
                         need_search = True
                         if total_targets == 1 and (not name or name == "当前窗口"):
                             need_search = False
-                            self.sig_log.emit("📍 锁定当前窗口")
+                            self._log("📍 锁定当前窗口")
                         
                         if need_search:
-                            self.sig_log.emit(f"🔍 切换: {name}")
+                            self._log(f"🔍 切换: {name}")
                             if not self.driver.search_contact(name):
-                                self.sig_log.emit(f"⚠️ 找不到: {name}")
+                                self._log(f"⚠️ 找不到: {name}")
                                 ops_done += current_count_setting
                                 self.sig_progress.emit(ops_done, total_ops_est, f"失败: {name}")
                                 continue
                             self._smart_sleep(0.5)
 
                         self.driver.focus_input_box(self.config.enable_human_simulation)
+                        # 搜索联系人可能改写过剪贴板，缓存失效
+                        self._last_clip = None
 
                         sent_count_for_this_person = 0
+                        is_stealth = self.config.enable_stealth_mode
                         
                         while True:
-                            if not self.is_running(): break
+                            if self._stop_event.is_set(): break
                             
-                            with self._mutex:
-                                current_limit = self.config.count_per_person
-                                current_interval_val = self.config.interval
+                            self._apply_pending_updates()
+                            current_limit = self.config.count_per_person
+                            current_interval_val = self.config.interval
                             
                             if sent_count_for_this_person >= current_limit:
                                 break
@@ -1317,33 +1657,51 @@ class AutomationWorker(QThread):
                                 active_msg = custom_msg
                                 active_files = custom_files
                             else:
-                                with self._mutex:
-                                    active_msg = self.config.global_msg
-                                    active_files = self.config.global_files
+                                active_msg = self.config.global_msg
+                                active_files = self.config.global_files
                             
+                            stealth_future = None
+                            if active_files and self.config.enable_stealth_mode:
+                                stealth_future = self._stealth_executor.submit(self.img_stealth.process_batch, active_files)
+
                             if active_msg:
-                                is_stealth = self.config.enable_stealth_mode
-                                final_msg = self.semantic.humanize(active_msg, current_limit, sent_count_for_this_person, is_stealth)
+                                # NOTE: 未开启隐形或只发一次时 humanize 原样返回，直接跳过调用
+                                if is_stealth and current_limit > 1:
+                                    final_msg = self.semantic.humanize(active_msg, current_limit, sent_count_for_this_person, is_stealth)
+                                else:
+                                    final_msg = active_msg
                                 
-                                pyperclip.copy(final_msg)
+                                self._copy_text(final_msg)
                                 self.driver.send_paste_and_enter(enable_human=self.config.enable_human_simulation)
                                 self._check_human_break()
                                 if active_files: self._smart_sleep(0.05)
 
+                            clip_error = None
                             if active_files:
                                 final_files = active_files
-                                if self.config.enable_stealth_mode:
-                                    final_files = self.img_stealth.process_batch(active_files)
+                                if stealth_future is not None:
+                                    final_files = stealth_future.result()
                                 
-                                self.clipboard_event.clear()
+                                self._last_clip = None
+                                clip_fut = Future()
+                                self._pending_clip_fut = clip_fut
                                 self.sig_set_clipboard_files.emit(final_files)
-                                if not self.clipboard_event.wait(timeout=5.0):
-                                    self.sig_log.emit("⚠️ 剪贴板设置超时，跳过本次附件发送")
+                                try:
+                                    clip_fut.result(timeout=TimingConfig.CLIPBOARD_TIMEOUT)
+                                except FutureTimeoutError:
+                                    self._log("⚠️ 剪贴板设置超时，跳过本次附件发送")
                                     logger.warning(f"Clipboard timeout for files: {final_files}")
-                                    continue
+                                    clip_error = "剪贴板设置超时"
+                                except Exception as clip_e:
+                                    self._log(f"⚠️ 剪贴板设置失败，跳过本次附件发送: {clip_e}")
+                                    clip_error = f"剪贴板设置失败: {clip_e}"
+                                finally:
+                                    self._pending_clip_fut = None
                                 
-                                self.driver.send_paste_and_enter(enable_human=self.config.enable_human_simulation)
-                                self._check_human_break()
+                                # NOTE: 剪贴板失败时本轮仍计为完成（记录失败），避免立即重发文字陷入死循环
+                                if clip_error is None:
+                                    self.driver.send_paste_and_enter(enable_human=self.config.enable_human_simulation)
+                                    self._check_human_break()
 
                             sent_count_for_this_person += 1
                             ops_done += 1
@@ -1357,13 +1715,15 @@ class AutomationWorker(QThread):
                                     content=active_msg[:100] if active_msg else "",
                                     has_attachment=bool(active_files),
                                     attachment_info=attach_info,
-                                    success=True
+                                    success=clip_error is None,
+                                    error_message=clip_error
                                 )
                             
                             now_time = time.time()
                             is_last_item = (ops_done >= est_total) or (sent_count_for_this_person >= current_limit)
                             
                             if is_last_item or (now_time - self.last_ui_update_time > 0.2):
+                                self._flush_log()
                                 self.sig_progress.emit(ops_done, est_total, f"发送 -> {name} ({sent_count_for_this_person})")
                                 self.last_ui_update_time = now_time
 
@@ -1374,31 +1734,33 @@ class AutomationWorker(QThread):
                     self._smart_sleep(0.5)
 
                 except Exception as inner_e:
-                    self.sig_log.emit(f"❌ 错误: {inner_e}")
+                    self._log(f"❌ 错误: {inner_e}")
                     self._smart_sleep(1)
             
-            if self.config.auto_minimize_done and self.is_running():
+            self._flush_log()
+            if self.config.auto_minimize_done and not self._stop_event.is_set():
                 # [Fix] 冷却时间：正常等待 1.0 秒
                 self.sig_log.emit("❄️ 冷却输入流 (1秒)...")
-                for _ in range(10):
-                    if not self.is_running(): break
-                    time.sleep(0.1)
+                self._stop_event.wait(timeout=1.0)
                 
-                if self.is_running():
+                if not self._stop_event.is_set():
                     self.sig_log.emit("📉 任务完成，发送归位信号...")
                     self.driver.minimize_async()
-            
-            self.img_stealth.cleanup_last_batch()
 
         except Exception as e:
+            self._flush_log()
             self.sig_error.emit(str(e))
         finally:
+            self._flush_log()
             try:
                 self.sig_progress.disconnect()
                 self.sig_log.disconnect()
                 self.sig_countdown.disconnect()
             except Exception as e:
                 logger.debug(f"AutomationWorker.run finally: 断开信号失败 - {e}")
+            self._stealth_executor.shutdown(wait=False)
+            # 异常退出时同样清理临时文件并释放引擎线程池
+            self.img_stealth.cleanup_last_batch()
             self.sig_finished.emit()
 
 # ==========================================
@@ -1432,17 +1794,20 @@ class SettingsManager:
         """
         self.settings.setValue(key, value)
     
-    def load(self, key: str, default=None):
+    def load(self, key: str, default=None, value_type: Optional[type] = None):
         """加载设置值
         
         Args:
             key: 设置键名
             default: 默认值
+            value_type: 目标类型（如 int/float/bool），由 QSettings 在 C++ 层完成转换
             
         Returns:
             设置值，如果不存在则返回默认值
         """
-        return self.settings.value(key, default)
+        if value_type is None:
+            return self.settings.value(key, default)
+        return self.settings.value(key, default, type=value_type)
     
     def save_geometry(self, geometry: bytes):
         """保存窗口几何信息
@@ -1460,6 +1825,10 @@ class SettingsManager:
         """
         return self.settings.value("geometry")
     
+    def sync(self):
+        """将挂起的设置写入持久化存储"""
+        self.settings.sync()
+
     def save_all(self, config: dict):
         """批量保存设置
         
@@ -1468,21 +1837,6 @@ class SettingsManager:
         """
         for key, value in config.items():
             self.settings.setValue(key, value)
-    
-    @staticmethod
-    def to_bool(value, default: bool = False) -> bool:
-        """将值转换为布尔值
-        
-        Args:
-            value: 待转换的值
-            default: 默认值
-            
-        Returns:
-            布尔值
-        """
-        if isinstance(value, bool):
-            return value
-        return str(value).lower() == 'true'
 
 
 class FileHandler:
@@ -1501,7 +1855,9 @@ class FileHandler:
     """
     
     # NOTE: 优化①：不再重复维护扩展名列表，直接引用 MediaExtensions.ALL，保持单一数据源
-    MEDIA_EXTENSIONS: tuple = tuple(MediaExtensions.ALL)
+    # 只取扩展名做 frozenset 哈希查找，不再对整条路径 lower() + 逐个 endswith
+    MEDIA_EXTENSIONS: frozenset = frozenset(MediaExtensions.ALL)
+    TEXT_EXTENSION: str = '.txt'
 
     def __init__(self):
         self.target_list: List[Tuple[str, str, List[str]]] = []
@@ -1519,14 +1875,14 @@ class FileHandler:
         Returns:
             Dict，包含 'img' / 'vid' / 'doc' 三个键，值为对应文件路径列表
         """
-        img_exts = tuple(MediaExtensions.IMAGE)
-        vid_exts = tuple(MediaExtensions.VIDEO)
+        img_exts = MediaExtensions.IMAGE
+        vid_exts = MediaExtensions.VIDEO
         result: Dict[str, List[str]] = {'img': [], 'vid': [], 'doc': []}
         for f in files:
-            fl = f.lower()
-            if fl.endswith(img_exts):
+            ext = os.path.splitext(f)[1].lower()
+            if ext in img_exts:
                 result['img'].append(f)
-            elif fl.endswith(vid_exts):
+            elif ext in vid_exts:
                 result['vid'].append(f)
             else:
                 result['doc'].append(f)
@@ -1559,26 +1915,11 @@ class FileHandler:
             Tuple[成功标志, 消息, 目标数量]
         """
         try:
-            targets = []
-            custom_count = 0
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split('|')
-                    name = parts[0].strip()
-                    content = ""
-                    files = []
-                    if len(parts) > 1:
-                        content = parts[1].strip()
-                    if len(parts) > 2:
-                        file_str = parts[2].strip()
-                        if file_str:
-                            files = [p.strip() for p in file_str.split(';') if p.strip()]
-                    if content or files:
-                        custom_count += 1
-                    targets.append((name, content, files))
+            # NOTE: 大块缓冲一次性读入，再用列表推导单遍解析
+            with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                lines = f.read().splitlines()
+            targets = [self._parse_line(line) for line in lines if line.strip()]
+            custom_count = sum(1 for _, c, fs in targets if c or fs)
             
             if not targets:
                 return False, "文件为空或格式错误", 0
@@ -1589,6 +1930,23 @@ class FileHandler:
         except Exception as e:
             return False, f"读取失败: {e}", 0
     
+    @staticmethod
+    def _parse_line(line: str) -> Tuple[str, str, List[str]]:
+        """解析名单中的一行：名称|专属消息|附件1;附件2
+
+        Args:
+            line: 名单文件中的一行（非空）
+
+        Returns:
+            (名称, 专属消息, 附件列表) 元组
+        """
+        name, _, rest = line.partition('|')
+        content, _, file_str = rest.partition('|')
+        # 与 split('|') 保持一致：第三段之后的内容不属于附件
+        file_str = file_str.partition('|')[0]
+        files = [p for p in map(str.strip, file_str.split(';')) if p] if file_str else []
+        return name.strip(), content.strip(), files
+
     def reset(self):
         """重置目标列表"""
         self.target_list = []
@@ -1603,7 +1961,7 @@ class FileHandler:
         Returns:
             是否为媒体文件
         """
-        return path.lower().endswith(cls.MEDIA_EXTENSIONS)
+        return os.path.splitext(path)[1].lower() in cls.MEDIA_EXTENSIONS
     
     @classmethod
     def is_text_file(cls, path: str) -> bool:
@@ -1615,7 +1973,7 @@ class FileHandler:
         Returns:
             是否为文本文件
         """
-        return path.lower().endswith('.txt')
+        return os.path.splitext(path)[1].lower() == cls.TEXT_EXTENSION
     
     @classmethod
     def filter_files(cls, files: List[str]) -> Tuple[List[str], List[str]]:
@@ -1627,8 +1985,13 @@ class FileHandler:
         Returns:
             Tuple[文本文件列表, 媒体文件列表]
         """
-        txt_files = [f for f in files if cls.is_text_file(f)]
-        media_files = [f for f in files if cls.is_media_file(f)]
+        txt_files, media_files = [], []
+        for f in files:
+            ext = os.path.splitext(f)[1].lower()
+            if ext == cls.TEXT_EXTENSION:
+                txt_files.append(f)
+            elif ext in cls.MEDIA_EXTENSIONS:
+                media_files.append(f)
         return txt_files, media_files
 
 
@@ -1727,16 +2090,12 @@ class TaskController:
         return True
     
     def _disconnect_signals(self):
-        """断开所有信号连接"""
+        """屏蔽旧 worker 的所有信号
+
+        NOTE: 一次 blockSignals 即可让旧任务不再发出任何信号，新增信号时也无需同步维护断开列表。
+        """
         if self.worker:
-            try:
-                self.worker.sig_finished.disconnect()
-                self.worker.sig_progress.disconnect()
-                self.worker.sig_log.disconnect()
-                self.worker.sig_set_clipboard_files.disconnect()
-                self.worker.sig_countdown.disconnect()
-            except Exception:
-                pass
+            self.worker.blockSignals(True)
     
     def update_runtime_content(self, content: str):
         """更新运行时内容
@@ -1771,6 +2130,15 @@ class TaskController:
         if self.worker:
             self.worker.on_clipboard_set_done()
 
+    def on_clipboard_set_failed(self, error: Exception):
+        """剪贴板设置失败回调
+
+        Args:
+            error: 设置剪贴板时抛出的异常
+        """
+        if self.worker:
+            self.worker.on_clipboard_set_failed(error)
+
 
 class LogBuffer:
     """日志缓冲器
@@ -1844,6 +2212,38 @@ class LogBuffer:
             return len(self._buffer)
 
 
+# NOTE: 主窗口样式表在模块导入时构建并压缩空白，实例化窗口时直接复用
+_STYLESHEET: str = re.sub(r'\s+', ' ', """
+    QMainWindow { background-color: #212121; color: #EEE; }
+    QLabel { color: #E0E0E0; }
+    QGroupBox { border: 1px solid #555; border-radius: 8px; margin-top: 12px; font-weight: bold; color: #81c784; padding-top: 20px; font-size: 13px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+    QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QListWidget { background-color: #333; color: #FFF; border: 1px solid #555; padding: 6px; border-radius: 4px; font-size: 12px;}
+    QLineEdit:focus, QTextEdit:focus, QListWidget:focus { border: 1px solid #81c784; }
+    QPushButton { background-color: #424242; color: #FFFFFF; border-radius: 6px; border: none; font-size: 14px; font-weight: bold; padding: 5px;}
+    QPushButton:hover { background-color: #616161; }
+    #BtnRun { background-color: #2e7d32; }
+    #BtnRun:hover { background-color: #388e3c; }
+    #BtnStop { background-color: #c62828; }
+    #BtnStop:hover { background-color: #d32f2f; }
+    #Title { font-size: 26px; color: #81c784; font-weight: bold; margin-bottom: 5px;}
+    #Subtitle { font-size: 13px; color: #888; margin-bottom: 15px; }
+    #Log { font-family: Consolas; font-size: 12px; background-color: #1a1a1a; color: #a5d6a7; border: none;}
+    QProgressBar { border: none; background: #333; height: 18px; border-radius: 9px; text-align: center; color: white; font-weight: bold;}
+    QProgressBar::chunk { background: #81c784; border-radius: 9px; }
+    QListWidget::item { padding: 5px; }
+    QListWidget::item:selected { background-color: #2e7d32; color: white; }
+    QCheckBox { color: #E0E0E0; font-weight: normal; }
+    QCheckBox::indicator { width: 16px; height: 16px; }
+    QDialog { background-color: #2b2b2b; }
+""").strip()
+
+# NOTE: 图标路径在导入时解析一次；QIcon 依赖 QApplication，首次创建窗口时再构建并缓存
+_ICON_PATH: Optional[str] = next(
+    (p for p in (os.path.join(get_app_dir(), "app.ico"), "app.ico") if os.path.exists(p)), None
+)
+
+
 class WeChatProUI(QMainWindow):
     """微信 Pro 主窗口
     
@@ -1865,6 +2265,9 @@ class WeChatProUI(QMainWindow):
         >>> window.show()
         >>> sys.exit(app.exec())
     """
+    _app_icon: Optional[QIcon] = None
+    URL_CACHE_LIMIT = 256
+
     def __init__(self):
         super().__init__()
         self.admin_suffix = " [ADMIN]" if ctypes.windll.shell32.IsUserAnAdmin() else " [USER]"
@@ -1883,17 +2286,34 @@ class WeChatProUI(QMainWindow):
             self.resize(980, 680) 
             
         self.target_datetime: Optional[QDateTime] = None 
+        # NOTE: 倒计时只有两种样式，仅在切换时调用 setStyleSheet
+        self._countdown_style_critical = "color: #ff5252; font-weight: bold; font-size: 16px;"
+        self._countdown_style_normal = "color: #81c784; font-weight: bold; font-size: 14px;"
+        self._countdown_last_critical: Optional[bool] = None
         
         self._init_ui()
+        # NOTE: 日志先进缓冲区，由定时器每 100ms 合并写入一次，避免逐条 append 触发重排重绘
+        self._log_buf = collections.deque()
+        # 时间戳的 HH:MM 部分按分钟缓存，每分钟只调用一次 strftime
+        self._last_minute = -1
+        self._minute_prefix = ""
+        # NOTE: 附件路径 -> QUrl 缓存，同一批附件发给多人时复用（隐形槽位路径同样固定复用）
+        self._url_cache: Dict[str, QUrl] = {}
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(100)
+        # NOTE: 输入与参数变化做 150ms 防抖，连续输入只向工作线程推送最后一次结果
+        self._text_debounce = self._make_debounce_timer(self._flush_text_to_worker)
+        self._params_debounce = self._make_debounce_timer(self._flush_params_to_worker)
         self._init_style()
         self._restore_settings()
+        self._track_settings_changes()
         self._setup_shortcuts()
         
-        internal_icon = os.path.join(get_app_dir(), "app.ico")
-        if os.path.exists(internal_icon):
-            self.setWindowIcon(QIcon(internal_icon))
-        elif os.path.exists("app.ico"):
-            self.setWindowIcon(QIcon("app.ico"))
+        if _ICON_PATH:
+            if WeChatProUI._app_icon is None:
+                WeChatProUI._app_icon = QIcon(_ICON_PATH)
+            self.setWindowIcon(WeChatProUI._app_icon)
 
     def _init_ui(self):
         main_widget = QWidget()
@@ -1956,6 +2376,8 @@ class WeChatProUI(QMainWindow):
         self.list_images.setMinimumHeight(100) 
         self.list_images.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.list_images.setToolTip("支持图片和视频，可拖入多个文件")
+        # NOTE: 与 list_images 同步维护的路径列表，读取附件时无需逐项访问 Qt 模型
+        self._files_cache: List[str] = []
         
         h_attach_head = QHBoxLayout()
         h_attach_head.addWidget(QLabel("📸 附件列表:"))
@@ -2116,6 +2538,9 @@ class WeChatProUI(QMainWindow):
         self.txt_log.setReadOnly(True)
         self.txt_log.setObjectName("Log")
         self.txt_log.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # NOTE: 日志只读，限制最大行数并关闭撤销栈，append 开销不随历史增长
+        self.txt_log.document().setMaximumBlockCount(2000)
+        self.txt_log.setUndoRedoEnabled(False)
         right_layout.addWidget(self.txt_log)
 
         main_layout.addWidget(left_widget, 55)
@@ -2123,30 +2548,7 @@ class WeChatProUI(QMainWindow):
         self.setAcceptDrops(True)
 
     def _init_style(self):
-        self.setStyleSheet("""
-            QMainWindow { background-color: #212121; color: #EEE; }
-            QLabel { color: #E0E0E0; }
-            QGroupBox { border: 1px solid #555; border-radius: 8px; margin-top: 12px; font-weight: bold; color: #81c784; padding-top: 20px; font-size: 13px; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-            QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QListWidget { background-color: #333; color: #FFF; border: 1px solid #555; padding: 6px; border-radius: 4px; font-size: 12px;}
-            QLineEdit:focus, QTextEdit:focus, QListWidget:focus { border: 1px solid #81c784; }
-            QPushButton { background-color: #424242; color: #FFFFFF; border-radius: 6px; border: none; font-size: 14px; font-weight: bold; padding: 5px;}
-            QPushButton:hover { background-color: #616161; }
-            #BtnRun { background-color: #2e7d32; }
-            #BtnRun:hover { background-color: #388e3c; }
-            #BtnStop { background-color: #c62828; }
-            #BtnStop:hover { background-color: #d32f2f; }
-            #Title { font-size: 26px; color: #81c784; font-weight: bold; margin-bottom: 5px;}
-            #Subtitle { font-size: 13px; color: #888; margin-bottom: 15px; }
-            #Log { font-family: Consolas; font-size: 12px; background-color: #1a1a1a; color: #a5d6a7; border: none;}
-            QProgressBar { border: none; background: #333; height: 18px; border-radius: 9px; text-align: center; color: white; font-weight: bold;}
-            QProgressBar::chunk { background: #81c784; border-radius: 9px; }
-            QListWidget::item { padding: 5px; }
-            QListWidget::item:selected { background-color: #2e7d32; color: white; }
-            QCheckBox { color: #E0E0E0; font-weight: normal; }
-            QCheckBox::indicator { width: 16px; height: 16px; }
-            QDialog { background-color: #2b2b2b; }
-        """)
+        self.setStyleSheet(_STYLESHEET)
     
     def _show_message_box(self, icon, title, text, buttons=QMessageBox.StandardButton.Ok, default_button=QMessageBox.StandardButton.Ok):
         """显示带样式的消息框
@@ -2178,10 +2580,23 @@ class WeChatProUI(QMainWindow):
         return msg_box.exec()
 
     def _setup_shortcuts(self):
-        self.listener = keyboard.Listener(on_press=self._on_key_press)
-        self.listener.start()
+        # NOTE: 窗口内的 Esc 由 Qt 事件循环处理；全局键盘钩子只在任务运行期间开启，空闲时零开销
+        self.listener = None
+        QShortcut(QKeySequence(Qt.Key.Key_Escape), self).activated.connect(self._stop)
         QShortcut(QKeySequence("Ctrl+Return"), self).activated.connect(lambda: self.btn_run.click())
         self._update_stats()
+
+    def _start_esc_listener(self):
+        """开启全局 Esc 监听（任务运行时微信在前台，需要全局钩子才能紧急刹车）"""
+        if self.listener is None:
+            self.listener = keyboard.Listener(on_press=self._on_key_press)
+            self.listener.start()
+
+    def _stop_esc_listener(self):
+        """关闭全局 Esc 监听"""
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
     
     def _update_stats(self):
         """更新统计面板"""
@@ -2197,17 +2612,35 @@ class WeChatProUI(QMainWindow):
 
     def _restore_settings(self):
         try:
-            self.spin_count.setValue(int(self.settings_manager.load("count", 10)))
-            self.spin_interval.setValue(float(self.settings_manager.load("interval", 0.05)))
-            self.spin_delay.setValue(int(self.settings_manager.load("delay", 3)))
+            load = self.settings_manager.load
+            self.spin_count.setValue(load("count", 10, int))
+            self.spin_interval.setValue(load("interval", 0.05, float))
+            self.spin_delay.setValue(load("delay", 3, int))
             
-            self.chk_stealth.setChecked(SettingsManager.to_bool(self.settings_manager.load("stealth", True)))
-            self.chk_human_sim.setChecked(SettingsManager.to_bool(self.settings_manager.load("human_sim", False)))
-            self.chk_auto_minimize.setChecked(SettingsManager.to_bool(self.settings_manager.load("auto_minimize", True)))
+            self.chk_stealth.setChecked(load("stealth", True, bool))
+            self.chk_human_sim.setChecked(load("human_sim", False, bool))
+            self.chk_auto_minimize.setChecked(load("auto_minimize", True, bool))
         except Exception:
             pass
 
+    def _track_settings_changes(self):
+        """监听需要持久化的控件，任一变化时标记设置为脏
+
+        NOTE: 在 _restore_settings 之后连接，恢复过程本身不会触发写入。
+        """
+        self._settings_dirty = False
+        for spin in (self.spin_count, self.spin_interval, self.spin_delay):
+            spin.valueChanged.connect(self._mark_settings_dirty)
+        for chk in (self.chk_stealth, self.chk_human_sim, self.chk_auto_minimize):
+            chk.toggled.connect(self._mark_settings_dirty)
+
+    def _mark_settings_dirty(self):
+        self._settings_dirty = True
+
     def _save_settings(self):
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
         self.settings_manager.save_all({
             "count": self.spin_count.value(),
             "interval": self.spin_interval.value(),
@@ -2226,31 +2659,71 @@ class WeChatProUI(QMainWindow):
             if self.task_controller.is_running():
                 self._stop()
     
+    def _make_debounce_timer(self, slot) -> QTimer:
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(150)
+        timer.timeout.connect(slot)
+        return timer
+
     def _on_text_changed(self):
+        self._text_debounce.start()
+
+    def _flush_text_to_worker(self):
         if self.task_controller.is_running():
             new_text = self.txt_msg.toPlainText().strip()
             self.task_controller.update_runtime_content(new_text)
 
     def _on_files_changed(self):
         if self.task_controller.is_running():
-            files = [self.list_images.item(i).text() for i in range(self.list_images.count())]
-            self.task_controller.update_runtime_files(files)
+            self.task_controller.update_runtime_files(self._files_cache.copy())
 
     def _on_params_changed(self):
-        current_interval = self.spin_interval.value()
-        
-        if current_interval > 1.0 and not self.chk_human_sim.isChecked():
+        # NOTE: 复选框联动立即生效（恢复设置时保存的选择随后会覆盖它），只有推送给工作线程的部分防抖
+        if self.spin_interval.value() > 1.0 and not self.chk_human_sim.isChecked():
             self.chk_human_sim.setChecked(True)
             self._log("💡 检测到间隔 > 1.0s，智能开启【真人拟态】")
+        self._params_debounce.start()
 
+    def _flush_params_to_worker(self):
         if self.task_controller.is_running():
-            new_count = self.spin_count.value()
-            self.task_controller.update_runtime_params(new_count, current_interval)
+            self.task_controller.update_runtime_params(self.spin_count.value(), self.spin_interval.value())
 
     def _remove_list_item(self, item):
-        self.list_images.takeItem(self.list_images.row(item))
+        self._files_remove_row(self.list_images.row(item))
         self._on_files_changed()
 
+    def _files_add(self, paths: List[str]):
+        """追加附件（同步更新控件与缓存）"""
+        self.list_images.addItems(paths)
+        self._files_cache.extend(paths)
+
+    def _files_remove_row(self, row: int):
+        """移除指定行的附件（同步更新控件与缓存）"""
+        self.list_images.takeItem(row)
+        del self._files_cache[row]
+
+    def _append_unique_files(self, files: List[str]) -> List[str]:
+        """将不重复的文件批量追加到附件列表
+
+        NOTE: 已有路径只在开始时收集一次为 set，新文件通过一次 addItems 写入控件。
+
+        Args:
+            files: 待追加的文件路径列表
+
+        Returns:
+            实际新增的文件路径列表
+        """
+        existing = set(self._files_cache)
+        new_files = []
+        for f in files:
+            if f not in existing:
+                existing.add(f)
+                new_files.append(f)
+        if new_files:
+            self._files_add(new_files)
+        return new_files
+
     def _open_media_dialog(self):
         img_exts = "*.png *.jpg *.jpeg *.gif *.bmp *.webp"
         vid_exts = "*.mp4 *.mov *.avi *.mkv *.wmv"
@@ -2266,12 +2739,7 @@ class WeChatProUI(QMainWindow):
 
         files, _ = QFileDialog.getOpenFileNames(self, "选择发送的文件（图片/视频/文档）", "", filters)
         if files:
-            added = []
-            existing = {self.list_images.item(i).text() for i in range(self.list_images.count())}
-            for f in files:
-                if f not in existing:
-                    self.list_images.addItem(f)
-                    added.append(f)
+            added = self._append_unique_files(files)
             if added:
                 # NOTE: 优化②⑤：调用统一的 format_file_summary，批量完成后只刷新一次
                 self._log(f"📂 已添加 {FileHandler.format_file_summary(added)}")
@@ -2308,20 +2776,28 @@ class WeChatProUI(QMainWindow):
         layout.addWidget(lbl_preview)
         
         preview_timer = QTimer(dialog)
+        # NOTE: 目标时间只在变更时换算为时间戳；每秒刷新仅做整数减法，样式变化时才重设
+        target_epoch = [dt_edit.dateTime().toSecsSinceEpoch()]
+        last_style = [None]
         def update_preview():
-            now = QDateTime.currentDateTime()
-            target = dt_edit.dateTime()
-            seconds = now.secsTo(target)
+            seconds = target_epoch[0] - int(time.time())
             if seconds < 0:
                 lbl_preview.setText("⚠️ 目标时间已过期")
-                lbl_preview.setStyleSheet("color: #e57373;")
+                new_style = "color: #e57373;"
             else:
                 m, s = divmod(seconds, 60)
                 h, m = divmod(m, 60)
                 lbl_preview.setText(f"预计等待: {seconds} 秒 ({int(h)}小时 {int(m)}分 {int(s)}秒)")
-                lbl_preview.setStyleSheet("color: #81c784;")
+                new_style = "color: #81c784;"
+            if new_style != last_style[0]:
+                lbl_preview.setStyleSheet(new_style)
+                last_style[0] = new_style
+
+        def on_target_changed(dt):
+            target_epoch[0] = dt.toSecsSinceEpoch()
+            update_preview()
         
-        dt_edit.dateTimeChanged.connect(update_preview)
+        dt_edit.dateTimeChanged.connect(on_target_changed)
         preview_timer.timeout.connect(update_preview)
         preview_timer.start(1000) 
         update_preview()
@@ -2333,7 +2809,7 @@ class WeChatProUI(QMainWindow):
         
         def on_accept():
             has_msg = bool(self.txt_msg.toPlainText().strip())
-            has_files = self.list_images.count() > 0
+            has_files = bool(self._files_cache)
             has_batch = bool(self.file_handler.target_list)
             
             if not has_batch and not has_msg and not has_files:
@@ -2374,29 +2850,40 @@ class WeChatProUI(QMainWindow):
             self._start()
 
     def _on_manual_delay_change(self):
-        if hasattr(self, 'target_datetime') and self.target_datetime:
+        if self.target_datetime:
             self.target_datetime = None
-            if hasattr(self, 'lbl_schedule_time'): self.lbl_schedule_time.hide()
+            self.lbl_schedule_time.hide()
 
     def _update_countdown_display(self, seconds_left):
-        if hasattr(self, 'lbl_schedule_time'):
-            self.lbl_schedule_time.show()
-            self.lbl_schedule_time.setText(f"🔥 引擎启动倒计时: {seconds_left} 秒")
-            if seconds_left <= 5:
-                self.lbl_schedule_time.setStyleSheet("color: #ff5252; font-weight: bold; font-size: 16px;")
-            else:
-                self.lbl_schedule_time.setStyleSheet("color: #81c784; font-weight: bold; font-size: 14px;")
+        self.lbl_schedule_time.show()
+        self.lbl_schedule_time.setText(f"🔥 引擎启动倒计时: {seconds_left} 秒")
+        critical = seconds_left <= 5
+        if critical != self._countdown_last_critical:
+            self.lbl_schedule_time.setStyleSheet(
+                self._countdown_style_critical if critical else self._countdown_style_normal
+            )
+            self._countdown_last_critical = critical
 
     def set_clipboard_files(self, file_paths):
         try:
             clipboard = QApplication.clipboard()
             mime_data = QMimeData()
-            urls = [QUrl.fromLocalFile(p) for p in file_paths]
+            url_cache = self._url_cache
+            # 超大批次每次发送都会产生新的临时路径，缓存超限时整体清空，防止无限增长
+            if len(url_cache) > self.URL_CACHE_LIMIT:
+                url_cache.clear()
+            urls = []
+            for p in file_paths:
+                url = url_cache.get(p)
+                if url is None:
+                    url = url_cache[p] = QUrl.fromLocalFile(p)
+                urls.append(url)
             mime_data.setUrls(urls)
             clipboard.setMimeData(mime_data)
         except Exception as e:
             self._log(f"⚠️ 复制文件失败: {e}")
-        finally:
+            self.task_controller.on_clipboard_set_failed(e)
+        else:
             self.task_controller.on_clipboard_set_done()
 
     def dragEnterEvent(self, event):
@@ -2412,10 +2899,7 @@ class WeChatProUI(QMainWindow):
             self._load_file(txt_files[0])
 
         if media_files:
-            existing = {self.list_images.item(i).text() for i in range(self.list_images.count())}
-            for f in media_files:
-                if f not in existing:
-                    self.list_images.addItem(f)
+            self._append_unique_files(media_files)
             # NOTE: 优化②⑤：调用统一的 format_file_summary，批量完成后只刷新一次
             summary = FileHandler.format_file_summary(media_files)
             if txt_files:
@@ -2453,16 +2937,31 @@ class WeChatProUI(QMainWindow):
         self._log("🔄 状态已重置")
 
     def _log(self, msg):
-        t = time.strftime("%H:%M:%S")
-        log_line = f"[{t}] {msg}"
-        self.log_buffer.append(log_line)
-        self.txt_log.append(log_line)
+        now = int(time.time())
+        minute = now // 60
+        if minute != self._last_minute:
+            self._minute_prefix = time.strftime("%H:%M", time.localtime(now))
+            self._last_minute = minute
+        prefix = f"[{self._minute_prefix}:{now % 60:02d}]"
+        # NOTE: 工作线程会把多条日志合并为一次信号（以换行分隔），逐行加时间戳并分别入缓冲
+        for line in msg.split("\n"):
+            log_line = f"{prefix} {line}"
+            self.log_buffer.append(log_line)
+            self._log_buf.append(log_line)
+
+    def _flush_log(self):
+        """将缓冲区中的日志一次性写入日志控件"""
+        if not self._log_buf:
+            return
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        self.txt_log.append("\n".join(lines))
         sb = self.txt_log.verticalScrollBar()
         sb.setValue(sb.maximum())
     
     def _export_log(self):
         """导出日志到文件"""
-        from PyQt6.QtWidgets import QFileDialog
         path, _ = QFileDialog.getSaveFileName(
             self, "导出日志", 
             f"wechat_pro_log_{time.strftime('%Y%m%d_%H%M%S')}.txt",
@@ -2477,6 +2976,7 @@ class WeChatProUI(QMainWindow):
     def _clear_log(self):
         """清空日志"""
         self.log_buffer.clear()
+        self._log_buf.clear()
         self.txt_log.clear()
         self._log("🗑️ 日志已清空")
 
@@ -2484,7 +2984,10 @@ class WeChatProUI(QMainWindow):
         self._save_settings()
         self.history_manager.clear_dedupe_cache()
         
-        if self.spin_interval.value() > 1.0 and not self.chk_human_sim.isChecked():
+        count_val = self.spin_count.value()
+        interval_val = self.spin_interval.value()
+        
+        if interval_val > 1.0 and not self.chk_human_sim.isChecked():
              self.chk_human_sim.setChecked(True)
              self._log("💡 启动检查：间隔 > 1.0s，已自动增强为【真人拟态】")
 
@@ -2493,7 +2996,7 @@ class WeChatProUI(QMainWindow):
         self.btn_stop.setEnabled(True)
 
         msg = self.txt_msg.toPlainText().strip()
-        global_files = [self.list_images.item(i).text() for i in range(self.list_images.count())]
+        global_files = self._files_cache.copy()
 
         targets = []
         is_batch = False
@@ -2507,10 +3010,11 @@ class WeChatProUI(QMainWindow):
             targets = [(name, "", [])]
 
         if is_batch:
-            missing_count = 0
-            for _, custom_msg, custom_files in targets:
-                if (not custom_msg and not custom_files) and (not msg and not global_files):
-                    missing_count += 1
+            # NOTE: 全局内容存在时所有目标都有内容可发，直接跳过逐个检查
+            if msg or global_files:
+                missing_count = 0
+            else:
+                missing_count = sum(1 for _, cm, cf in targets if not cm and not cf)
             if missing_count > 0:
                 if missing_count == len(targets):
                     self._show_message_box(QMessageBox.Icon.Warning, "拒绝执行", "所有目标均无内容！")
@@ -2540,7 +3044,7 @@ class WeChatProUI(QMainWindow):
         start_delay_secs = 0
         
         if self.target_datetime:
-            target_ts = self.target_datetime.toMSecsSinceEpoch() / 1000.0
+            target_ts = float(self.target_datetime.toSecsSinceEpoch())
             now_ts = time.time()
             start_delay_secs = max(0, int(target_ts - now_ts))
         else:
@@ -2552,8 +3056,8 @@ class WeChatProUI(QMainWindow):
             target_list=targets,
             global_msg=msg,
             global_files=global_files, 
-            count_per_person=self.spin_count.value(),
-            interval=self.spin_interval.value(),
+            count_per_person=count_val,
+            interval=interval_val,
             start_delay=start_delay_secs,
             target_timestamp=target_ts,
             enable_stealth_mode=self.chk_stealth.isChecked(),
@@ -2562,11 +3066,8 @@ class WeChatProUI(QMainWindow):
         )
 
         self.pbar.setValue(0)
-        ops_per_person = 0
-        if msg: ops_per_person += 1
-        if global_files: ops_per_person += 1
-        if ops_per_person == 0: ops_per_person = 1
-        self.pbar.setMaximum(len(targets) * self.spin_count.value() * ops_per_person)
+        ops_per_person = (bool(msg) + bool(global_files)) or 1
+        self.pbar.setMaximum(len(targets) * count_val * ops_per_person)
         
         if self.task_controller.is_running():
             self._log("⚠️ 正在强制覆盖旧任务...")
@@ -2580,6 +3081,7 @@ class WeChatProUI(QMainWindow):
             on_countdown=self._update_countdown_display,
             history_manager=self.history_manager
         )
+        self._start_esc_listener()
 
     def _stop(self):
         if self.task_controller.is_running():
@@ -2596,15 +3098,19 @@ class WeChatProUI(QMainWindow):
         self.btn_stop.setEnabled(False)
         self.setWindowTitle("WeChat Pro 2026")
         self._log("🏁 任务完成")
+        self._stop_esc_listener()
         self._update_stats()
         
         if self.chk_auto_minimize.isChecked():
             QTimer.singleShot(500, self._perform_minimize_logic)
         
         self.target_datetime = None 
-        if hasattr(self, 'lbl_schedule_time'): self.lbl_schedule_time.hide()
+        self.lbl_schedule_time.hide()
 
     def _perform_minimize_logic(self):
+        # 窗口已在前台且未最小化时无需再次激活，避免多余的窗口管理调用
+        if self.isActiveWindow() and not self.isMinimized():
+            return
         try:
             self._log("✨ 自动归位已触发")
             self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized | Qt.WindowState.WindowActive)
@@ -2617,7 +3123,8 @@ class WeChatProUI(QMainWindow):
     def closeEvent(self, event):
         self.settings_manager.save_geometry(self.saveGeometry())
         self._save_settings() 
-        if self.listener: self.listener.stop()
+        self.settings_manager.sync()
+        self._stop_esc_listener()
         self.task_controller.stop()
         event.accept()
 